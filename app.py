@@ -1,5 +1,39 @@
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 from flask import Flask, request, jsonify, send_from_directory
 
+from wordcount_mr import (
+    load_data, warm_up,
+    single_threaded_wordcount, multi_threaded_wordcount,
+)
+
+# Tokenizer regexes are compiled when wordcount_mr is imported; also run the
+# tokenizer once now so the single-threaded count doesn't wait on the Numba JIT
+warm_up()
+
+# Map workers shared by every request, so no request pays for process startup;
+# each worker warms its own copy of the kernel as it starts, before taking tasks
+def _new_pool():
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=warm_up)
+
+_POOL = _new_pool()
+_POOL_LOCK = threading.Lock()
+
+def _replace_pool(broken):
+    """Swap a fresh pool in for broken, unless another request already did."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is broken:
+            _POOL = _new_pool()
+            broken.shutdown(wait=False)
+
+# Most Map tasks one request may queue on the shared pool
+_MAX_MAP_TASKS = 64
+
 # --- Flask App ---
 app = Flask(__name__, static_folder='.', static_url_path='')
 
@@ -18,10 +52,26 @@ def wordcount_api():
             raise ValueError()
     except ValueError:
         return "Invalid thread count", 400
-    # read lines
-    content = file.stream.read().decode('utf-8').splitlines()
-    single_counts, single_time = single_threaded_wordcount(content)
-    multi_counts, multi_time = multi_threaded_wordcount(content, num_threads)
+    # spool the upload to disk; the Map workers read their byte ranges from it
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'upload.txt')
+        file.save(path)
+        # one Map task per byte at most, and never enough to swamp _POOL
+        num_threads = max(1, min(num_threads, _MAX_MAP_TASKS, os.path.getsize(path)))
+        # unmap the upload before the directory and its file are removed
+        with load_data(path) as content:
+            single_counts, single_time = single_threaded_wordcount(content)
+        # a dead worker (e.g. OOM-killed) breaks the whole pool: rebuild it
+        # and retry once before giving up on this request
+        for _ in range(2):
+            pool = _POOL
+            try:
+                multi_counts, multi_time = multi_threaded_wordcount(path, num_threads, pool)
+                break
+            except BrokenProcessPool:
+                _replace_pool(pool)
+        else:
+            return "Word-count workers crashed, try again", 503
     return jsonify({
         'single_time': single_time,
         'multi_time': multi_time,
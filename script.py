@@ -2,26 +2,36 @@ import logging
 from logging import info
 import threading  # library functions for multi threading
 import time  # library functions for time formats
-import random  # library functions for generating random numbers
+
+try:
+	from numba import njit  # compiles the Collatz loop to native code
+except ImportError:
+	njit = None
 
 # The followings are global variables
 writeable = True  # Allow Producer to start first
 bufferCell = 0
 t = time.time()
-lock = threading.Lock()
+cond = threading.Condition()  # guards writeable/bufferCell and wakes waiters
 
-def hotpoFunc(id, s, t):
-	myId = id
-	logging.info("range from %d to %d", s, t)
+def collatzRange(s, t):
 	n=s
 	for e in range(s, t):
 		n = e
 		while (n > 1):
 			if (n % 2 == 0): # if n is even
-				n = n / 2 # Integer division
+				n = n // 2 # Integer division
 			else:
 				n = 3 * n + 1
-		e = e+1
+	return n
+
+if njit is not None:
+	collatzRange = njit(nogil=True, cache=True)(collatzRange)  # release the GIL so threads overlap
+
+def hotpoFunc(id, s, t):
+	myId = id
+	logging.info("range from %d to %d", s, t)
+	collatzRange(s, t)
 	logging.info("Thread %s completed", myId)
 
 def Producer(id):
@@ -33,31 +43,25 @@ def Producer(id):
 	i = 0
 	while (t > time.time() - 10):  # Run producer for 10 seconds
 		i = i + 1
-		while (writeable == False):
-			delay = random.randint(1, 3)
-			info("Producer delays: %d seconds", delay)
-			time.sleep(delay)
-		lock.acquire()
-		if (writeable == True):
+		with cond:
+			cond.wait_for(lambda: writeable)  # block until the cell is free
 			info("Producer %s: generates Item= %d", my_id, i)
 			bufferCell = i
 			writeable = False
-		lock.release()
+			cond.notify_all()
 
 def Consumer(id):
 	global writeable
 	global bufferCell
 	logging.info("Consumer Thread %s: starting", id)
 	while x.is_alive():
-		while (writeable == True) and x.is_alive():
-			delay = random.randint(1, 5)
-			info("Consumer %s delays %d: seconds", id, delay)
-			time.sleep(delay)
-		lock.acquire()
-		if (writeable == False):
+		with cond:
+			# time out periodically so we notice when the producer has finished
+			if not cond.wait_for(lambda: not writeable, timeout=1):
+				continue
 			info("Consumer %s: receives item=%d", id, bufferCell)
 			writeable = True
-		lock.release()
+			cond.notify_all()
 
 
 if __name__ == "__main__":
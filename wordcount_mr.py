@@ -3,7 +3,7 @@
 Multithreaded MapReduce Word Count
 
 This script counts occurrences of each word (case-insensitive) in a text file,
-using a MapReduce approach with Python threading.
+using a MapReduce approach with a pool of worker processes.
 
 Usage:
   python3 wordcount_mr.py --file data.txt --threads 4
@@ -11,112 +11,229 @@ Usage:
 If --file is omitted, you’ll be prompted to enter it interactively.
 """
 
-import threading
 import time
 import argparse
 import re
 import json
-from collections import defaultdict
-from mapcount_mt_r import single_threaded_wordcount, multi_threaded_wordcount
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+from contextlib import contextmanager, nullcontext
 
+try:
+    import numpy as np
+    from numba import njit, types
+    from numba.typed import Dict
+except ImportError:  # fall back to tokenize() + Counter
+    njit = None
 
+# Tokenizer pattern, compiled once and shared by every Map call; it runs on
+# raw bytes already lowered with _LOWER, so no str decoding is needed
+_WORD_RE = re.compile(rb"[a-z]+")
+
+# 256-entry table mapping A-Z to a-z and every other byte to itself
+_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+
+# Bytes lowered per step by lower_chunks, bounding the single-threaded copy
+_LOWER_CHUNK = 1 << 23  # 8 MiB
+
+
+@contextmanager
 def load_data(file_path):
-    """Load all lines from the given text file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.readlines()
+    """Memory-map the given text file read-only for the body of a with block.
+
+    Yields a memoryview over the mapping (an empty view for an empty file,
+    which cannot be mapped); the mapping is closed when the block exits.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield memoryview(b"")
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                yield view
+
+def lower_chunk(data):
+    """Lowercase ASCII letters in raw bytes with a table lookup (no decoding)."""
+    return data.translate(_LOWER)
+
+def lower_chunks(data, size=_LOWER_CHUNK):
+    """Yield data lowered in pieces of about size bytes, never splitting a word.
+
+    Only one piece is copied out of data at a time, so a mapped file is never
+    held in memory whole.
+    """
+    carry = b""
+    for pos in range(0, len(data), size):
+        piece = carry + lower_chunk(bytes(data[pos:pos + size]))
+        # hold back a trailing partial word for the next piece
+        cut = len(piece.rstrip(b"abcdefghijklmnopqrstuvwxyz"))
+        carry = piece[cut:]
+        yield piece[:cut]
+    yield carry
+
+def decode_counts(counts):
+    """Turn byte-string keys into str once, after counting is done."""
+    return Counter({word.decode('ascii'): n for word, n in counts.items()})
+
+def tokenize(buf):
+    """Split lowered bytes into a list of words.
 
-def single_threaded_wordcount(lines):
+    findall beats streaming finditer matches into a Counter, and callers
+    only pass pieces of at most about _LOWER_CHUNK bytes, so the list stays
+    bounded.
+    """
+    return _WORD_RE.findall(buf)
+
+if njit is not None:
+    @njit(cache=True)
+    def _grow(arr, size):
+        """Copy arr into a new int64 array with room for size entries."""
+        out = np.empty(size, dtype=np.int64)
+        out[:arr.size] = arr
+        return out
+
+    @njit(cache=True)
+    def _count_kernel(buf):
+        """Count a-z runs in a byte buffer, one array slot per distinct word.
+
+        Returns (starts, lens, counts, ok): the offset and length of each
+        word's first occurrence and how often it occurs, plus False if two
+        different words shared a hash (the arrays are then unusable).
+        """
+        # rolling hash of a word -> its slot in the arrays below
+        slots = Dict.empty(key_type=types.int64, value_type=types.int64)
+        starts = np.empty(1024, dtype=np.int64)
+        lens = np.empty(1024, dtype=np.int64)
+        counts = np.empty(1024, dtype=np.int64)
+        used = 0
+        start = -1
+        h = 0
+        for i in range(buf.size + 1):
+            c = buf[i] if i < buf.size else 0
+            if 97 <= c <= 122:
+                if start < 0:
+                    start = i
+                    h = 0
+                h = h * 131 + c
+            elif start >= 0:
+                n = i - start
+                if h in slots:
+                    # the hash wraps, so check this run against the first one
+                    slot = slots[h]
+                    if lens[slot] != n:
+                        return starts[:used], lens[:used], counts[:used], False
+                    first = starts[slot]
+                    for k in range(n):
+                        if buf[first + k] != buf[start + k]:
+                            return (starts[:used], lens[:used],
+                                    counts[:used], False)
+                    counts[slot] += 1
+                else:
+                    if used == starts.size:
+                        starts = _grow(starts, 2 * used)
+                        lens = _grow(lens, 2 * used)
+                        counts = _grow(counts, 2 * used)
+                    slots[h] = used
+                    starts[used] = start
+                    lens[used] = n
+                    counts[used] = 1
+                    used += 1
+                start = -1
+        return starts[:used], lens[:used], counts[:used], True
+else:
+    _count_kernel = None
+
+def count_words(buf):
+    """Count words in lowered bytes, using the Numba kernel when available."""
+    if _count_kernel is None:
+        return Counter(tokenize(buf))
+    starts, lens, counts, ok = _count_kernel(np.frombuffer(buf, dtype=np.uint8))
+    if not ok:  # hash collision: count this chunk exactly instead
+        return Counter(tokenize(buf))
+    # plain lists, so no per-entry boxing out of Numba containers
+    return Counter({
+        buf[s:s + n]: c
+        for s, n, c in zip(starts.tolist(), lens.tolist(), counts.tolist())
+    })
+
+def warm_up():
+    """Count a tiny buffer once so the Numba kernel is compiled or loaded now.
+
+    Also usable as a ProcessPoolExecutor initializer to warm each worker.
+    """
+    count_words(lower_chunk(b"warm up"))
+
+def single_threaded_wordcount(data):
     """Count words in one thread."""
     start = time.time()
-    counts = defaultdict(int)
-    for line in lines:
-        for word in re.findall(r"[A-Za-z]+", line.lower()):
-            counts[word] += 1
+    counts = Counter()
+    for piece in lower_chunks(data):
+        counts.update(count_words(piece))
+    counts = decode_counts(counts)
     duration = time.time() - start
     return counts, duration
 
-def map_task(part_lines, intermediate, index):
-    """Map function: count words in a partition."""
-    counts = defaultdict(int)
-    for line in part_lines:
-        for word in re.findall(r"[A-Za-z]+", line.lower()):
-            counts[word] += 1
-    intermediate[index] = counts
-
-def reduce_task(keys, intermediate, reduced, index):
-    """Reduce function: sum counts for assigned keys across all map outputs."""
-    counts = defaultdict(int)
-    for part_counts in intermediate:
-        for key in keys:
-            if key in part_counts:
-                counts[key] += part_counts[key]
-    reduced[index] = counts
-
-def combiner_task(reduced, final_counts):
-    """Combiner function: merge all reduced dicts into the final result."""
-    for part_counts in reduced:
-        for word, cnt in part_counts.items():
-            final_counts[word] = final_counts.get(word, 0) + cnt
-
-def multi_threaded_wordcount(lines, num_threads):
-    """Orchestrate Map, Reduce, and Combiner threads and measure total time."""
+def map_task(file_path, offset, length):
+    """Map function: count the words in one byte range of the file.
+
+    The range is lowered and counted a bounded piece at a time.
+    """
+    counts = Counter()
+    with load_data(file_path) as data, data[offset:offset + length] as chunk:
+        for piece in lower_chunks(chunk):
+            counts.update(count_words(piece))
+    return counts
+
+def chunk_ranges(file_path, num_chunks):
+    """Yield (offset, length) pairs covering the file, each ending on a newline."""
+    total = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        offset = 0
+        for i in range(1, num_chunks + 1):
+            end = total
+            if i < num_chunks:
+                f.seek(max(total * i // num_chunks, offset))
+                f.readline()  # heal the boundary: finish the current line
+                end = min(f.tell(), total)
+            yield offset, end - offset
+            offset = end
+
+def multi_threaded_wordcount(file_path, num_threads, executor=None):
+    """Run Map tasks in worker processes, merge their counts, and time the run.
+
+    Pass a long-lived ProcessPoolExecutor as executor to reuse its workers;
+    otherwise a pool of num_threads workers is created for this call.
+    """
     start = time.time()
 
-    # 1. Partition data lines into N chunks
-    total = len(lines)
-    size = total // num_threads
-    partitions = [
-        lines[i*size : (i+1)*size if i < num_threads-1 else total]
-        for i in range(num_threads)
-    ]
-
-    # 2. Launch Map threads
-    intermediate = [None] * num_threads
-    map_threads = []
-    for i, part in enumerate(partitions):
-        t = threading.Thread(target=map_task, args=(part, intermediate, i))
-        map_threads.append(t)
-        t.start()
-    for t in map_threads:
-        t.join()
-
-    # 3. Shuffle: collect all unique words
-    unique_words = set()
-    for d in intermediate:
-        unique_words.update(d.keys())
-    sorted_keys = sorted(unique_words)
-
-    # 4. Partition keys for Reduce
-    ksize = len(sorted_keys) // num_threads
-    key_groups = [
-        sorted_keys[i*ksize : (i+1)*ksize if i < num_threads-1 else len(sorted_keys)]
-        for i in range(num_threads)
-    ]
-
-    # 5. Launch Reduce threads
-    reduced = [None] * num_threads
-    reduce_threads = []
-    for i, keys in enumerate(key_groups):
-        t = threading.Thread(target=reduce_task, args=(keys, intermediate, reduced, i))
-        reduce_threads.append(t)
-        t.start()
-    for t in reduce_threads:
-        t.join()
-
-    # 6. Launch Combiner thread
-    final_counts = {}
-    combiner = threading.Thread(target=combiner_task, args=(reduced, final_counts))
-    combiner.start()
-    combiner.join()
+    # 1. Stream newline-aligned byte ranges to Map tasks in worker processes;
+    #    each worker reads its own range, so no lines are held here
+    # 2. Reduce: fold each partial count into the result as soon as it arrives,
+    #    while later Map tasks are still running; no intermediate list is kept
+    final_counts = Counter()
+    if executor is None:
+        pool = ProcessPoolExecutor(max_workers=num_threads)
+    else:
+        pool = nullcontext(executor)
+    with pool as map_pool:
+        futures = [
+            map_pool.submit(map_task, file_path, offset, length)
+            for offset, length in chunk_ranges(file_path, num_threads)
+        ]
+        for fut in futures:
+            final_counts.update(fut.result())
 
     duration = time.time() - start
-    return final_counts, duration
+    return decode_counts(final_counts), duration
 
 def main():
-    parser = argparse.ArgumentParser(description='MapReduce Word Count with Multithreading')
+    parser = argparse.ArgumentParser(description='MapReduce Word Count with a process pool')
     parser.add_argument('--file', help='Path to input data file')
     parser.add_argument('--threads', type=int, default=4,
-                        help='Number of threads for Map/Reduce (default: 4)')
+                        help='Number of Map worker processes (default: 4)')
     args = parser.parse_args()
 
     # Interactive fallback if no file provided
@@ -124,12 +241,12 @@ def main():
     num_threads = args.threads
 
     print(f"\nSingle-threaded run on “{file_path}”...")
-    lines = load_data(file_path)
-    single_counts, single_time = single_threaded_wordcount(lines)
+    with load_data(file_path) as data:
+        single_counts, single_time = single_threaded_wordcount(data)
     print(f"  → Time: {single_time:.4f} seconds; unique words: {len(single_counts)}")
 
-    print(f"\nMultithreaded MapReduce run with {num_threads} threads...")
-    multi_counts, multi_time = multi_threaded_wordcount(lines, num_threads)
+    print(f"\nMapReduce run with {num_threads} worker processes...")
+    multi_counts, multi_time = multi_threaded_wordcount(file_path, num_threads)
     print(f"  → Time: {multi_time:.4f} seconds; unique words: {len(multi_counts)}")
 
     # Output final counts as JSON
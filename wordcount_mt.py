@@ -3,7 +3,7 @@
 Multithreaded MapReduce Word Count
 
 This script counts occurrences of each word (case-insensitive) in a text file,
-using a MapReduce approach with Python threading.
+using a MapReduce approach with a pool of worker processes.
 
 Usage:
   python3 wordcount_mt.py --file data.txt --threads 4
@@ -11,164 +11,132 @@ Usage:
 If --file is omitted, you’ll be prompted to enter it interactively.
 """
 
+import os
 import re
 import time
 import argparse
-import threading
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
+from operator import add
 
+# Tokenizer pattern, compiled once; it runs on raw bytes lowered with _LOWER,
+# where \w is ASCII-only, so no text is decoded before counting
+_WORD_RE = re.compile(rb"\w+")
 
+# 256-entry table mapping A-Z to a-z and every other byte to itself
+_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
 
-#─── Map Thread ──────────────────────────────────────────────────────────────
-class MapThread(threading.Thread):
-    def __init__(self, chunk_lines, result_list, lock, thread_id):
-        super().__init__(name=f"Map-{thread_id}")
-        # join the lines into one string for tokenization
-        self.text = "\n".join(chunk_lines).lower()
-        self.result_list = result_list
-        self.lock = lock
-
-    def run(self):
-        # tokenize on word characters
-        words = re.findall(r"\w+", self.text)
-        local_counts = Counter(words)
-        # store this thread's result
-        with self.lock:
-            self.result_list.append(local_counts)
-
-
-#─── Reduce Thread ────────────────────────────────────────────────────────────
-class ReduceThread(threading.Thread):
-    def __init__(self, key, partial_counters, result_dict, lock):
-        super().__init__(name=f"Reduce-{key}")
-        self.key = key
-        self.partials = partial_counters
-        self.result_dict = result_dict
-        self.lock = lock
-
-    def run(self):
-        total = sum(d.get(self.key, 0) for d in self.partials)
-        with self.lock:
-            self.result_dict[self.key] = total
-
-
-#─── Combiner Thread ──────────────────────────────────────────────────────────
-class CombinerThread(threading.Thread):
-    def __init__(self, reduced_dict, result_list, lock):
-        super().__init__(name="Combiner")
-        self.reduced = reduced_dict
-        self.result_list = result_list
-        self.lock = lock
-
-    def run(self):
-        # produce a sorted list of (word, count) descending
-        sorted_pairs = sorted(
-            self.reduced.items(),
-            key=lambda kv: kv[1],
-            reverse=True
-        )
-        with self.lock:
-            self.result_list.extend(sorted_pairs)
+
+# Bytes read per step, bounding the copy each count holds at once
+_BLOCK_SIZE = 1 << 23  # 8 MiB
+
+
+def read_blocks(rf, end, size=_BLOCK_SIZE):
+    """
+    Yields the open binary file's bytes from its current position up to end,
+    about size bytes at a time. Each block is extended to the end of its line,
+    so no word is split; end must itself fall on a line boundary.
+    """
+    while rf.tell() < end:
+        block = rf.read(min(size, end - rf.tell()))
+        if rf.tell() < end:
+            block += rf.readline()
+        yield block
+
+
+def decode_counts(counts):
+    """Turns the byte-string keys into str once, after counting is done."""
+    return Counter({word.decode('ascii'): n for word, n in counts.items()})
+
+
+#─── Map Phase ───────────────────────────────────────────────────────────────
+def map_range(filepath, start, end):
+    # read only this worker's byte range, a block at a time, and lower each
+    # block with a table lookup
+    counts = Counter()
+    with open(filepath, 'rb') as rf:
+        rf.seek(start)
+        for block in read_blocks(rf, end):
+            data = block.translate(_LOWER)
+            # tokenize on word characters; blocks are bounded, so findall's
+            # list stays small and beats streaming finditer matches
+            counts.update(_WORD_RE.findall(data))
+    return counts
 
 
 #─── Single-threaded word count ───────────────────────────────────────────────
-def single_thread_count(lines):
-    text = "\n".join(lines).lower()
-    words = re.findall(r"\w+", text)
-    return Counter(words)
+def single_thread_count(filepath):
+    # the whole file is one range; it is never held in memory at once
+    return decode_counts(map_range(filepath, 0, os.path.getsize(filepath)))
 
 
 #─── Multithreaded Map-Reduce-Combiner ────────────────────────────────────────
-def multithreaded_count(lines, num_threads):
-    # 1) Map phase
-    chunk_size = (len(lines) + num_threads - 1) // num_threads
-    partial_maps = []
-    map_lock = threading.Lock()
-    map_threads = []
-
-    for i in range(num_threads):
-        chunk = lines[i*chunk_size : (i+1)*chunk_size]
-        t = MapThread(chunk, partial_maps, map_lock, i)
-        map_threads.append(t)
-        t.start()
-    for t in map_threads:
-        t.join()
-
-    # 2) Shuffle: collect all unique words
-    all_counters = partial_maps
-    keys = set().union(*all_counters) if all_counters else set()
-
-    # 3) Reduce phase
-    reduced = {}
-    reduce_lock = threading.Lock()
-    reduce_threads = []
-    for key in keys:
-        t = ReduceThread(key, all_counters, reduced, reduce_lock)
-        reduce_threads.append(t)
-        t.start()
-    for t in reduce_threads:
-        t.join()
-
-    # 4) Combiner phase
-    combined_list = []
-    comb_lock = threading.Lock()
-    combiner = CombinerThread(reduced, combined_list, comb_lock)
-    combiner.start()
-    combiner.join()
-
-    # build final dict (preserves sorted order in Python 3.7+)
-    return dict(combined_list)
-
-
-def read_lines(filepath):
+def byte_ranges(filepath, num_chunks):
     """
-    Attempts to read a file as UTF-8; if that fails, falls back to Latin-1.
-    Returns a list of lines without trailing newlines.
+    Splits the file into num_chunks (start, end) byte ranges, moving each
+    boundary forward to the end of the line it falls in.
     """
-    try:
-        with open(filepath, encoding='utf-8') as rf:
-            return [line.rstrip('\n') for line in rf]
-    except UnicodeDecodeError:
-        with open(filepath, encoding='latin-1') as rf:
-            return [line.rstrip('\n') for line in rf]
+    total = os.path.getsize(filepath)
+    bounds = [0]
+    with open(filepath, 'rb') as rf:
+        for i in range(1, num_chunks):
+            rf.seek(max(total * i // num_chunks, bounds[-1]))
+            rf.readline()
+            bounds.append(min(rf.tell(), total))
+    bounds.append(total)
+    return list(zip(bounds, bounds[1:]))
+
+
+def multithreaded_count(filepath, num_threads):
+    # 1) Map phase: send each process a (filepath, start, end) range to read
+    #    itself, rather than pickling its lines over
+    starts, ends = zip(*byte_ranges(filepath, num_threads))
+    # run each range in its own process; threads would serialize on the GIL
+    with ProcessPoolExecutor(max_workers=num_threads) as executor:
+        partial_maps = list(executor.map(
+            map_range, repeat(filepath), starts, ends
+        ))
+
+    # 2) Reduce phase: merge the partial Counters in one pass each
+    # (callers rank with most_common(n), so no full sort happens here)
+    return decode_counts(reduce(add, partial_maps, Counter()))
+
 
 def main():
     p = argparse.ArgumentParser(
-        description="Word-Count: single vs Map/Reduce/Combiner multithread"
+        description="Word-Count: single vs Map/Reduce/Combiner multiprocess"
     )
     p.add_argument("--file", "-f", required=True, help="Path to text file")
-    p.add_argument("--threads", "-t", type=int, default=2, help="Number of Map threads")
+    p.add_argument("--threads", "-t", type=int, default=2, help="Number of Map worker processes")
     args = p.parse_args()
 
-    # Use robust file reading
-    lines = read_lines(args.file)
-
-    print(f"\nFile: {args.file!r}, Lines: {len(lines)}, Threads: {args.threads}\n")
+    size = os.path.getsize(args.file)
+    print(f"\nFile: {args.file!r}, Bytes: {size}, Threads: {args.threads}\n")
 
     # Single-thread
     t0 = time.perf_counter()
-    single_counts = single_thread_count(lines)
+    single_counts = single_thread_count(args.file)
     t1 = time.perf_counter()
     print(f"Single-thread: {t1-t0:.3f}s, unique words: {len(single_counts)}")
 
     # Multithreaded Map/Reduce/Combiner
     t2 = time.perf_counter()
-    multi_counts = multithreaded_count(lines, args.threads)
+    multi_counts = multithreaded_count(args.file, args.threads)
     t3 = time.perf_counter()
     print(f"Multi-thread : {t3-t2:.3f}s, unique words: {len(multi_counts)}\n")
 
     # Verify correctness
-    if dict(single_counts) == multi_counts:
+    if single_counts == multi_counts:
         print("✅ Counts match single-threaded result.")
     else:
         print("⚠️ Counts differ! (unexpected)")
 
-    # Top 20
-    print("\nTop 20 words:")
-    for idx, (w, c) in enumerate(multi_counts.items(), 1):
+    # Top 25
+    print("\nTop 25 words:")
+    for idx, (w, c) in enumerate(multi_counts.most_common(25), 1):
         print(f"{idx:2d}. {w!r}: {c}")
-        if idx >= 25:
-            break
 
 
 if __name__ == "__main__":